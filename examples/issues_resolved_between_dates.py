@@ -3,14 +3,21 @@ Example: List issues resolved between two dates for a given project, using a cus
 """
 from youtrack.client import YouTrackClient
 
+# Hoisted template so loops over many date ranges (e.g. weekly reports) reuse
+# one pre-built string instead of re-assembling the query each iteration.
+QUERY_TMPL = "project:{project_id} 'Release Status':Resolved Resolved: {start_date} .. {end_date}"
+
 client = YouTrackClient.from_config()
 
 project_id = "0-0"  # Replace with your project ID
 start_date = "2025-07-01"  # YYYY-MM-DD
 end_date = "2025-07-08"    # YYYY-MM-DD
 
-# YouTrack query: project:<project_id> 'Release Status':Resolved Resolved: {start_date} .. {end_date}
-query = f"project:{project_id} 'Release Status':Resolved Resolved: {start_date} .. {end_date}"
+query = QUERY_TMPL.format_map({
+    "project_id": project_id,
+    "start_date": start_date,
+    "end_date": end_date,
+})
 
 issues = client.search_issues(query)
 
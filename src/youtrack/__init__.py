@@ -2,4 +2,23 @@
 YouTrack API client package.
 """
 
-from .client import YouTrackClient
+__all__ = ["YouTrackClient", "YouTrackError", "AsyncYouTrackClient"]
+
+#: Lazily resolved attribute -> defining submodule. Importing the package
+#: (e.g. for the CLI's --help) stays cheap: requests/urllib3 load only when
+#: a client is first used, and httpx only for the async client.
+_LAZY_ATTRS = {
+    "YouTrackClient": "client",
+    "YouTrackError": "client",
+    "AsyncYouTrackClient": "async_client",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        from importlib import import_module
+        return getattr(import_module(f".{module_name}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
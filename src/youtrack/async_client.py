@@ -0,0 +1,321 @@
+"""
+Async YouTrack API client implementation.
+
+This module provides AsyncYouTrackClient, an asyncio counterpart to
+YouTrackClient backed by httpx.AsyncClient. All requests share one pooled
+connection (HTTP/2 when the `h2` extra is installed), so callers can overlap
+many API calls with asyncio.gather instead of paying serial round-trips.
+
+Requires the optional `httpx` dependency (`pip install youtrack[async]`).
+
+Usage:
+    import asyncio
+    from youtrack.async_client import AsyncYouTrackClient
+
+    async def main():
+        async with AsyncYouTrackClient.from_config() as client:
+            results = await asyncio.gather(
+                client.search_issues("project: ABC #Unresolved"),
+                client.search_issues("project: XYZ #Unresolved"),
+            )
+
+    asyncio.run(main())
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "httpx is required for the async client; install it with "
+        "'pip install httpx' (optionally 'httpx[http2]')"
+    ) from e
+
+from youtrack.client import YouTrackError, _load_config
+
+
+class AsyncYouTrackClient:
+    def __init__(self, token: str, base_url: str):
+        self.token = token
+        self.base_url = base_url
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        try:
+            self._client = httpx.AsyncClient(http2=True, limits=limits, headers=headers, verify=False)
+        except ImportError:
+            # The h2 extra is not installed; HTTP/1.1 keep-alive still pools.
+            self._client = httpx.AsyncClient(limits=limits, headers=headers, verify=False)
+
+    @classmethod
+    def from_config(cls, config_path: Optional[str] = None):
+        """
+        Load YouTrack credentials from a .youtrack.toml file.
+        """
+        config_file = config_path or str(Path.home() / ".youtrack.toml")
+        config = _load_config(config_file)
+        token = config["youtrack"]["token"]
+        base_url = config["youtrack"]["base_url"]
+        return cls(token, base_url)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _handle_response(self, response):
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            try:
+                error = response.json()
+                message = error.get('error_description') or error.get('message') or str(error)
+            except Exception:
+                message = response.text
+            raise YouTrackError(f"YouTrack API error: {message}") from e
+        return response.json()
+
+    async def list_issues(self, project_id: str, query: str = "", limit: int = 20, skip: int = 0):
+        """
+        List issues in a project with optional query and pagination.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :param query: YouTrack query string.
+        :type query: str, optional
+        :param limit: Max results to return.
+        :type limit: int, optional
+        :param skip: Results to skip.
+        :type skip: int, optional
+        :return: List of issues.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/issues?fields=id,summary,description&query=project:{project_id} {query}&$skip={skip}&$top={limit}"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def search_issues(self, query: str, limit: int = 20, skip: int = 0):
+        """
+        Search for issues using a YouTrack query.
+
+        :param query: YouTrack query string.
+        :type query: str
+        :param limit: Max results to return.
+        :type limit: int, optional
+        :param skip: Results to skip.
+        :type skip: int, optional
+        :return: List of issues.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/issues?fields=id,summary,description&query={query}&$skip={skip}&$top={limit}"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def get_issue(self, issue_id: str):
+        """
+        Retrieve details for a specific issue by its ID.
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :return: Issue details including id, summary, description, and project info.
+        :rtype: dict
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}?fields=id,summary,description,project(id,name)"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def gather_issues(self, issue_ids):
+        """
+        Fetch many issues concurrently over the shared connection pool.
+
+        :param issue_ids: Issue IDs to fetch.
+        :type issue_ids: list
+        :return: Issue details, in the same order as issue_ids.
+        :rtype: list
+        """
+        return list(await asyncio.gather(*(self.get_issue(i) for i in issue_ids)))
+
+    async def list_workitems(self, project_id: str, limit: int = 20, skip: int = 0):
+        """
+        List workitems (time tracking entries) in a project, with pagination support.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :param limit: Max results to return.
+        :type limit: int, optional
+        :param skip: Results to skip.
+        :type skip: int, optional
+        :return: List of workitems.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/issues?fields=id,summary,workItems(id,duration,author,date,description)&query=project:{project_id}&$skip={skip}&$top={limit}"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def list_users(self, query: str = "", limit: int = 20, skip: int = 0):
+        """
+        List users in the YouTrack instance, optionally filtered by a query string.
+
+        :param query: Query string to filter users (e.g., by name or email).
+        :type query: str, optional
+        :param limit: Maximum number of users to return.
+        :type limit: int, optional
+        :param skip: Number of users to skip (for pagination).
+        :type skip: int, optional
+        :return: List of user dicts with id, login, name, and email.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/users?fields=id,login,name,email&query={query}&$skip={skip}&$top={limit}"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def create_issue(self, project_id: str, summary: str, description: str = "", custom_fields: dict = None, story_points: int = None):
+        """
+        Create a new issue in the specified project.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :param summary: The issue summary/title.
+        :type summary: str
+        :param description: The issue description.
+        :type description: str, optional
+        :param custom_fields: Custom fields to set.
+        :type custom_fields: dict, optional
+        :param story_points: Value for the 'Story points' custom field. Required in some workflows.
+        :type story_points: int, optional
+        :return: The created issue data.
+        :rtype: dict
+        """
+        url = f"{self.base_url}/api/issues?fields=id,summary,description"
+        data = {
+            "project": {"id": project_id},
+            "summary": summary,
+            "description": description
+        }
+        custom_fields = custom_fields.copy() if custom_fields else {}
+        if story_points is not None:
+            custom_fields["Story points"] = {"name": str(story_points), "value": story_points}
+        if custom_fields:
+            data["customFields"] = [
+                {"name": k, **(v if isinstance(v, dict) else {"value": v})}
+                for k, v in custom_fields.items()
+            ]
+        response = await self._client.post(url, json=data)
+        return self._handle_response(response)
+
+    async def update_issue(self, issue_id: str, summary: str = None, description: str = None, custom_fields: dict = None):
+        """
+        Update an existing issue with new information.
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :param summary: New summary.
+        :type summary: str, optional
+        :param description: New description.
+        :type description: str, optional
+        :param custom_fields: Custom fields to update.
+        :type custom_fields: dict, optional
+        :return: The updated issue data.
+        :rtype: dict
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}?fields=id,summary,description"
+        data = {}
+        if summary is not None:
+            data["summary"] = summary
+        if description is not None:
+            data["description"] = description
+        if custom_fields:
+            data["customFields"] = custom_fields
+        response = await self._client.post(url, json=data)
+        return self._handle_response(response)
+
+    async def add_comment(self, issue_id: str, text: str):
+        """
+        Add a comment to an issue.
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :param text: The comment text.
+        :type text: str
+        :return: The created comment data.
+        :rtype: dict
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}/comments?fields=id,text,author"
+        response = await self._client.post(url, json={"text": text})
+        return self._handle_response(response)
+
+    async def get_issue_history(self, issue_id: str):
+        """
+        Retrieve the history and changes of an issue.
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :return: List of activity records.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}/activities?fields=id,timestamp,author,added,removed"
+        response = await self._client.get(url)
+        return self._handle_response(response)
+
+    async def calculate_time_spent(self, issue_id: str):
+        """
+        Calculate total time spent on an issue by summing its workitems' durations.
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :return: Total time spent (minutes).
+        :rtype: int
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}/timeTracking/workItems?fields=duration"
+        response = await self._client.get(url)
+        workitems = self._handle_response(response)
+        return sum(wi.get('duration', 0) for wi in workitems)
+
+    async def run_command(self, issue_id: str, command: str, comment: str = None):
+        """
+        Run a command on an issue (e.g., change state, assign, add comment, etc.).
+
+        :param issue_id: The ID of the issue.
+        :type issue_id: str
+        :param command: The command string to execute (YouTrack command language).
+        :type command: str
+        :param comment: Optional comment to add with the command.
+        :type comment: str, optional
+        :return: The response from the API (usually the updated issue info).
+        :rtype: dict
+        """
+        url = f"{self.base_url}/api/issues/{issue_id}/execute"
+        data = {"query": command}
+        if comment:
+            data["comment"] = {"text": comment}
+        response = await self._client.post(url, json=data)
+        return self._handle_response(response)
+
+    async def run_query(self, query: str, fields: str = "id,summary,description", limit: int = 20, skip: int = 0):
+        """
+        Run a search query on issues, returning selected fields.
+
+        :param query: YouTrack query string.
+        :type query: str
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
+        :param limit: Max results to return.
+        :type limit: int, optional
+        :param skip: Results to skip.
+        :type skip: int, optional
+        :return: List of issues matching the query.
+        :rtype: list
+        """
+        url = f"{self.base_url}/api/issues?fields={fields}&query={query}&$skip={skip}&$top={limit}"
+        response = await self._client.get(url)
+        return self._handle_response(response)
@@ -1,31 +1,69 @@
+import concurrent.futures
+import functools
+import json
+import sys
+
+import click
 import typer
-from youtrack.client import YouTrackClient
-from typing import Optional
+from typing import List, Optional
 
 app = typer.Typer(help="YouTrack CLI - interact with YouTrack from the command line.")
 
+# Shared option definitions, built once instead of per command at import time.
+PROJECT_ID_OPTION = typer.Option(..., help="Project ID")
+ISSUE_ID_OPTION = typer.Option(..., help="Issue ID")
+BOARD_ID_OPTION = typer.Option(..., help="Board ID")
+SPRINT_ID_OPTION = typer.Option(..., help="Sprint ID")
+LIMIT_OPTION = typer.Option(20, help="Max results to return")
+SKIP_OPTION = typer.Option(0, help="Results to skip")
+NO_CACHE_OPTION = typer.Option(False, "--no-cache", help="Bypass the metadata cache")
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
+def _emit(obj):
+    """Write a payload to stdout as indented JSON (via orjson when available)."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        json.dump(obj, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Build the client once and reuse it across commands in the same process."""
+    # Imported lazily so --help and shell completion don't pay for requests/urllib3.
+    from youtrack.client import YouTrackClient
+    return YouTrackClient.from_config()
+
 @app.command()
 def list_issues(
-    project_id: str = typer.Option(..., help="Project ID"),
+    project_id: str = PROJECT_ID_OPTION,
     query: str = typer.Option("", help="YouTrack query string"),
-    limit: int = typer.Option(20, help="Max results to return"),
-    skip: int = typer.Option(0, help="Results to skip")
+    limit: int = LIMIT_OPTION,
+    skip: int = SKIP_OPTION
 ):
     """List issues in a project."""
-    client = YouTrackClient.from_config()
-    issues = client.list_issues(project_id, query, limit, skip)
-    for issue in issues:
-        typer.echo(f"{issue['id']}: {issue['summary']}")
+    client = _get_client()
+    # Write rows straight to stdout: echo's per-call color/stream resolution
+    # dominates when piping thousands of rows.
+    out = click.get_text_stream("stdout")
+    for issue in client.iter_issues(project_id, query, skip=skip, limit=limit, fields="id,summary"):
+        out.write(f"{issue['id']}: {issue['summary']}\n")
+    out.flush()
 
 @app.command()
 def create_issue(
-    project_id: str = typer.Option(..., help="Project ID"),
+    project_id: str = PROJECT_ID_OPTION,
     summary: str = typer.Option(..., help="Issue summary/title"),
     description: str = typer.Option("", help="Issue description"),
     story_points: Optional[int] = typer.Option(None, help="Story points value")
 ):
     """Create a new issue."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     issue = client.create_issue(
         project_id=project_id,
         summary=summary,
@@ -36,270 +74,188 @@ def create_issue(
 
 @app.command()
 def add_comment(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     text: str = typer.Option(..., help="Comment text")
 ):
     """Add a comment to an issue."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     comment = client.add_comment(issue_id, text)
     typer.echo(f"Added comment: {comment['id']}")
 
 @app.command()
 def search_issues(
     query: str = typer.Option(..., help="YouTrack query string"),
-    limit: int = typer.Option(20, help="Max results to return"),
-    skip: int = typer.Option(0, help="Results to skip")
+    limit: int = LIMIT_OPTION,
+    skip: int = SKIP_OPTION
 ):
     """Search for issues using a YouTrack query."""
-    client = YouTrackClient.from_config()
-    issues = client.search_issues(query, limit, skip)
+    client = _get_client()
+    issues = client.search_issues(query, limit, skip, fields="id,summary")
+    out = click.get_text_stream("stdout")
     for issue in issues:
-        typer.echo(f"{issue['id']}: {issue['summary']}")
+        out.write(f"{issue['id']}: {issue['summary']}\n")
+    out.flush()
 
 @app.command()
 def update_issue(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     summary: Optional[str] = typer.Option(None, help="New summary"),
     description: Optional[str] = typer.Option(None, help="New description"),
     story_points: Optional[int] = typer.Option(None, help="Story points value"),
 ):
     """Update an existing issue."""
-    client = YouTrackClient.from_config()
-    custom_fields = {}
-    if story_points is not None:
-        custom_fields["Story points"] = {"name": str(story_points), "value": story_points}
+    client = _get_client()
+    custom_fields = (
+        {"Story points": {"name": str(story_points), "value": story_points}}
+        if story_points is not None else None
+    )
     issue = client.update_issue(
         issue_id=issue_id,
         summary=summary,
         description=description,
-        custom_fields=custom_fields if custom_fields else None
+        custom_fields=custom_fields
     )
     typer.echo(f"Updated issue: {issue['id']}")
 
 @app.command()
 def transition_issue(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     field_name: str = typer.Option(..., help="Custom field name (e.g., 'State' or 'Release Status')"),
     new_state: str = typer.Option(..., help="New state value")
 ):
     """Transition an issue to a new workflow state by updating a custom field."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     issue = client.transition_issue(issue_id, field_name, new_state)
     typer.echo(f"Transitioned issue: {issue['id']}")
 
 @app.command()
 def attach_file(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     file_path: str = typer.Option(..., help="Path to file to attach")
 ):
     """Attach a file to an issue."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     attachment = client.attach_file(issue_id, file_path)
     typer.echo(f"Attached file: {attachment['id']}")
 
-@app.command()
-def get_issue_history(
-    issue_id: str = typer.Option(..., help="Issue ID")
-):
-    """Retrieve the history and changes of an issue."""
-    client = YouTrackClient.from_config()
-    history = client.get_issue_history(issue_id)
-    typer.echo(history)
-
 @app.command()
 def list_workitems(
-    project_id: str = typer.Option(..., help="Project ID"),
-    limit: int = typer.Option(20, help="Max results to return"),
-    skip: int = typer.Option(0, help="Results to skip")
+    project_id: str = PROJECT_ID_OPTION,
+    limit: int = LIMIT_OPTION,
+    skip: int = SKIP_OPTION
 ):
     """List workitems (time tracking entries) in a project."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     workitems = client.list_workitems(project_id, limit, skip)
-    typer.echo(workitems)
+    _emit(workitems)
 
 @app.command()
 def calculate_time_spent(
-    issue_id: str = typer.Option(..., help="Issue ID")
+    issue_id: str = ISSUE_ID_OPTION
 ):
     """Calculate total time spent on an issue."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     total = client.calculate_time_spent(issue_id)
     typer.echo(f"Total time spent: {total} minutes")
 
-@app.command()
-def list_workitem_types(
-    project_id: str = typer.Option(..., help="Project ID")
-):
-    """List allowed workitem types for a project."""
-    client = YouTrackClient.from_config()
-    types = client.list_workitem_types(project_id)
-    typer.echo(types)
-
 @app.command()
 def add_spent_time(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     duration: int = typer.Option(..., help="Time spent in minutes"),
     workitem_type_id: str = typer.Option(..., help="Workitem type ID"),
     description: str = typer.Option("", help="Description for the workitem")
 ):
     """Add spent time (workitem) to an issue."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     workitem = client.add_spent_time(issue_id, duration, workitem_type_id, description)
     typer.echo(f"Added workitem: {workitem['id']}")
 
 @app.command()
-def list_projects():
-    """List all projects."""
-    client = YouTrackClient.from_config()
-    projects = client.list_projects()
-    typer.echo(projects)
-
-@app.command()
-def get_issue(
-    issue_id: str = typer.Option(..., help="Issue ID")
+def batch_get_issues(
+    issue_ids: List[str] = typer.Option(..., "--issue-id", help="Issue ID (repeat for multiple issues)"),
+    workers: int = typer.Option(8, help="Number of concurrent fetches")
 ):
-    """Get details for a specific issue."""
-    client = YouTrackClient.from_config()
-    issue = client.get_issue(issue_id)
-    typer.echo(issue)
+    """Fetch several issues concurrently, printing each as it arrives."""
+    client = _get_client()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(client.get_issue, issue_id): issue_id for issue_id in issue_ids}
+        for future in concurrent.futures.as_completed(futures):
+            _emit(future.result())
 
 @app.command()
 def list_users(
     query: str = typer.Option("", help="Query string to filter users"),
-    limit: int = typer.Option(20, help="Max results to return"),
-    skip: int = typer.Option(0, help="Results to skip")
+    limit: int = LIMIT_OPTION,
+    skip: int = SKIP_OPTION
 ):
     """List users."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     users = client.list_users(query, limit, skip)
-    typer.echo(users)
-
-@app.command()
-def list_custom_fields(
-    project_id: str = typer.Option(..., help="Project ID")
-):
-    """List custom fields for a project."""
-    client = YouTrackClient.from_config()
-    fields = client.list_custom_fields(project_id)
-    typer.echo(fields)
-
-@app.command()
-def list_workflows():
-    """List all workflows."""
-    client = YouTrackClient.from_config()
-    workflows = client.list_workflows()
-    typer.echo(workflows)
+    _emit(users)
 
 @app.command()
 def list_boards(
     project_id: Optional[str] = typer.Option(None, help="Project ID to filter boards")
 ):
     """List all agile boards."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     boards = client.list_boards(project_id)
-    typer.echo(boards)
-
-@app.command()
-def list_sprints(
-    board_id: str = typer.Option(..., help="Board ID")
-):
-    """List all sprints for a given agile board."""
-    client = YouTrackClient.from_config()
-    sprints = client.list_sprints(board_id)
-    typer.echo(sprints)
+    _emit(boards)
 
 @app.command()
 def list_user_stories(
-    board_id: str = typer.Option(..., help="Board ID"),
+    board_id: str = BOARD_ID_OPTION,
     sprint_id: Optional[str] = typer.Option(None, help="Sprint ID")
 ):
     """List user stories (epics) on a board."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     stories = client.list_user_stories(board_id, sprint_id)
-    typer.echo(stories)
+    _emit(stories)
 
 @app.command()
 def add_issue_to_sprint(
-    board_id: str = typer.Option(..., help="Board ID"),
-    sprint_id: str = typer.Option(..., help="Sprint ID"),
-    issue_id: str = typer.Option(..., help="Issue ID")
+    board_id: str = BOARD_ID_OPTION,
+    sprint_id: str = SPRINT_ID_OPTION,
+    issue_id: str = ISSUE_ID_OPTION
 ):
     """Add an issue to a sprint on a board."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     result = client.add_issue_to_sprint(board_id, sprint_id, issue_id)
-    typer.echo(result)
+    _emit(result)
+
+@app.command()
+def add_issues_to_sprint(
+    board_id: str = BOARD_ID_OPTION,
+    sprint_id: str = SPRINT_ID_OPTION,
+    issue_ids: List[str] = typer.Option(..., "--issue-id", help="Issue ID (repeat for multiple issues)"),
+    workers: int = typer.Option(8, help="Number of concurrent requests")
+):
+    """Add several issues to a sprint on a board in one go."""
+    client = _get_client()
+    results = client.add_issues_to_sprint(board_id, sprint_id, issue_ids, workers)
+    _emit(results)
 
 @app.command()
 def add_issue_to_user_story(
-    board_id: str = typer.Option(..., help="Board ID"),
+    board_id: str = BOARD_ID_OPTION,
     user_story_id: str = typer.Option(..., help="User story (epic) ID"),
-    issue_id: str = typer.Option(..., help="Issue ID")
+    issue_id: str = ISSUE_ID_OPTION
 ):
     """Add an issue as a subtask to a user story (epic) on a board."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     result = client.add_issue_to_user_story(board_id, user_story_id, issue_id)
-    typer.echo(result)
+    _emit(result)
 
 @app.command()
 def add_user_story_to_sprint(
-    board_id: str = typer.Option(..., help="Board ID"),
-    sprint_id: str = typer.Option(..., help="Sprint ID"),
+    board_id: str = BOARD_ID_OPTION,
+    sprint_id: str = SPRINT_ID_OPTION,
     user_story_id: str = typer.Option(..., help="User story (epic) ID")
 ):
     """Add a user story (epic) to a sprint on a board."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     result = client.add_user_story_to_sprint(board_id, sprint_id, user_story_id)
-    typer.echo(result)
-
-@app.command()
-def run_report(
-    report_id: str = typer.Option(..., help="Report ID")
-):
-    """Run a report by its ID and return the result."""
-    client = YouTrackClient.from_config()
-    result = client.run_report(report_id)
-    typer.echo(result)
-
-@app.command()
-def get_deadline_calendars():
-    """Retrieve all deadline calendars (holiday calendars) in the instance."""
-    client = YouTrackClient.from_config()
-    calendars = client.get_deadline_calendars()
-    typer.echo(calendars)
-
-@app.command()
-def get_issue_links(
-    issue_id: str = typer.Option(..., help="Issue ID")
-):
-    """Get all links for a specific issue."""
-    client = YouTrackClient.from_config()
-    links = client.get_issue_links(issue_id)
-    typer.echo(links)
-
-@app.command()
-def list_issue_link_types():
-    """List all available issue link types in the instance."""
-    client = YouTrackClient.from_config()
-    types = client.list_issue_link_types()
-    typer.echo(types)
-
-@app.command()
-def list_issue_link_types_for_issue(
-    issue_id: str = typer.Option(..., help="Issue ID")
-):
-    """List link types available for a specific issue."""
-    client = YouTrackClient.from_config()
-    types = client.list_issue_link_types_for_issue(issue_id)
-    typer.echo(types)
-
-@app.command()
-def list_issue_link_types_for_project(
-    project_id: str = typer.Option(..., help="Project ID")
-):
-    """List link types available for a specific project."""
-    client = YouTrackClient.from_config()
-    types = client.list_issue_link_types_for_project(project_id)
-    typer.echo(types)
+    _emit(result)
 
 @app.command()
 def add_issue_link(
@@ -308,32 +264,111 @@ def add_issue_link(
     link_type_id: str = typer.Option(..., help="Link type ID")
 ):
     """Add a link between two issues using a specific link type."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     result = client.add_issue_link(source_issue_id, target_issue_id, link_type_id)
-    typer.echo(result)
+    _emit(result)
 
 @app.command()
 def run_query(
     query: str = typer.Option(..., help="YouTrack query string"),
     fields: str = typer.Option("id,summary,description", help="Comma-separated fields to return for each issue"),
-    limit: int = typer.Option(20, help="Max results to return"),
-    skip: int = typer.Option(0, help="Results to skip")
+    limit: int = LIMIT_OPTION,
+    skip: int = SKIP_OPTION
 ):
     """Run a search query on issues, returning selected fields."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     issues = client.run_query(query, fields, limit, skip)
-    typer.echo(issues)
+    _emit(issues)
 
 @app.command()
 def run_command(
-    issue_id: str = typer.Option(..., help="Issue ID"),
+    issue_id: str = ISSUE_ID_OPTION,
     command: str = typer.Option(..., help="Command string to execute (YouTrack command language)"),
     comment: Optional[str] = typer.Option(None, help="Optional comment to add with the command")
 ):
     """Run a command on an issue (e.g., change state, assign, add comment, etc.)."""
-    client = YouTrackClient.from_config()
+    client = _get_client()
     result = client.run_command(issue_id, command, comment)
-    typer.echo(result)
+    _emit(result)
+
+# Simple pass-through commands: each builds the client, calls one method with at
+# most one ID argument, and JSON-dumps the result. Generated from a table so a
+# new endpoint is one line here instead of another near-identical function.
+# Entries: (method name, option parameter or None, option help, docstring, cached)
+_SIMPLE_COMMANDS = [
+    ("list_projects", None, None, "List all projects.", True),
+    ("list_workflows", None, None, "List all workflows.", True),
+    ("list_issue_link_types", None, None, "List all available issue link types in the instance.", True),
+    ("get_deadline_calendars", None, None, "Retrieve all deadline calendars (holiday calendars) in the instance.", True),
+    ("get_issue", "issue_id", "Issue ID", "Get details for a specific issue.", False),
+    ("get_issue_history", "issue_id", "Issue ID", "Retrieve the history and changes of an issue.", False),
+    ("get_issue_links", "issue_id", "Issue ID", "Get all links for a specific issue.", False),
+    ("list_issue_link_types_for_issue", "issue_id", "Issue ID", "List link types available for a specific issue.", False),
+    ("list_issue_link_types_for_project", "project_id", "Project ID", "List link types available for a specific project.", False),
+    ("list_workitem_types", "project_id", "Project ID", "List allowed workitem types for a project.", True),
+    ("list_custom_fields", "project_id", "Project ID", "List custom fields for a project.", True),
+    ("list_sprints", "board_id", "Board ID", "List all sprints for a given agile board.", False),
+    ("run_report", "report_id", "Report ID", "Run a report by its ID and return the result.", False),
+]
+
+def _make_simple_command(method_name, param, param_help, doc, cached):
+    option_name = "--" + param.replace("_", "-") if param else None
+    if param and cached:
+        def command(value: str = typer.Option(..., option_name, help=param_help),
+                    no_cache: bool = NO_CACHE_OPTION):
+            client = _get_client()
+            if no_cache:
+                client.invalidate_cache(method_name)
+            _emit(getattr(client, method_name)(value))
+    elif param:
+        def command(value: str = typer.Option(..., option_name, help=param_help)):
+            _emit(getattr(_get_client(), method_name)(value))
+    elif cached:
+        def command(no_cache: bool = NO_CACHE_OPTION):
+            client = _get_client()
+            if no_cache:
+                client.invalidate_cache(method_name)
+            _emit(getattr(client, method_name)())
+    else:
+        def command():
+            _emit(getattr(_get_client(), method_name)())
+    command.__name__ = method_name
+    command.__doc__ = doc
+    return command
+
+for _entry in _SIMPLE_COMMANDS:
+    app.command(name=_entry[0].replace("_", "-"))(_make_simple_command(*_entry))
+
+app_async = typer.Typer(help="Async variants of read commands (requires the optional httpx dependency).")
+app.add_typer(app_async, name="async")
+
+def _run_async(coro):
+    """Run an async CLI entry point, using uvloop when installed."""
+    import asyncio
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    return asyncio.run(coro)
+
+@app_async.command()
+def run_query_many(
+    queries: List[str] = typer.Option(..., "--query", help="YouTrack query string (repeat for multiple queries)"),
+    limit: int = typer.Option(20, help="Max results per query"),
+):
+    """Run several search queries concurrently and print the results per query."""
+    import asyncio
+    from youtrack.async_client import AsyncYouTrackClient
+
+    async def _run():
+        async with AsyncYouTrackClient.from_config() as client:
+            return await asyncio.gather(*(client.search_issues(query, limit) for query in queries))
+
+    for query, issues in zip(queries, _run_async(_run())):
+        typer.echo(f"# {query}")
+        if issues:
+            typer.echo("\n".join(f"{issue['id']}: {issue['summary']}" for issue in issues))
 
 if __name__ == "__main__":
     app()
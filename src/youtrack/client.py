@@ -23,19 +23,203 @@ Usage:
 See each method's docstring for details.
 """
 
-import toml
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlencode
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # fall back to in-memory multipart bodies
+    MultipartEncoder = None
+
+try:
+    import ijson
+except ImportError:  # fall back to whole-body parsing
+    ijson = None
+
+#: How long cached metadata lookups (projects, custom fields, ...) stay fresh.
+METADATA_CACHE_TTL = 300
+
+#: Workflows change about as rarely as anything in YouTrack; cache them longer.
+WORKFLOW_CACHE_TTL = 600
+
+#: Default field selection for issue endpoints.
+_ISSUE_FIELDS = "id,summary,description"
+
+#: JSON request bodies above this many bytes are gzip-compressed on upload.
+_GZIP_BODY_THRESHOLD = 4096
+
+#: Seconds before any HTTP call gives up instead of hanging.
+_DEFAULT_TIMEOUT = 30
+
+#: Most entries per client in the ETag revalidation cache.
+_ETAG_CACHE_MAX = 128
+
+#: Parsed config files, keyed by absolute path; entries carry the file's
+#: mtime so an edited config is re-read automatically.
+_CONFIG_CACHE = {}
+
+def _load_config(config_file):
+    """
+    Parse a TOML config file, deferring the parser import until needed.
+
+    Prefers the stdlib tomllib (Python 3.11+, C-backed); falls back to the
+    pure-Python toml package on older interpreters. Parsed configs are
+    memoized by (path, mtime) so repeated client construction skips the
+    re-read and re-parse.
+    """
+    path = os.path.abspath(config_file)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        import tomllib
+    except ImportError:
+        import toml
+        config = toml.load(path)
+    else:
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    _CONFIG_CACHE[path] = (mtime, config)
+    return config
+
+def _loads(raw):
+    """Parse JSON response bytes, using orjson when installed (2-3x faster)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data):
+    """Serialize a request body to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
 
 class YouTrackError(Exception):
     """Custom exception for YouTrack API errors with meaningful messages."""
     pass
 
 class YouTrackClient:
-    def __init__(self, token: str, base_url: str):
+    # Fixed attribute layout: no per-instance __dict__, slightly faster
+    # attribute access, and typos fail loudly at assignment time.
+    __slots__ = (
+        "token",
+        "base_url",
+        "_headers_cached",
+        "_json_headers",
+        "_issues_url",
+        "_session",
+        "_cache",
+        "_etag_cache",
+        "_etag_lock",
+    )
+
+    def __init__(self, token: str, base_url: str, cache_path: Optional[str] = None):
         self.token = token
         self.base_url = base_url
+        # The token never changes, so the header dict is built exactly once.
+        self._headers_cached = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        # Sent only with JSON-bodied requests; GETs omit Content-Type.
+        self._json_headers = {"Content-Type": "application/json"}
+        # The /api/issues prefix is on nearly every call; build it once.
+        self._issues_url = f"{base_url}/api/issues"
+        self._session = self._build_session(cache_path)
+        self._cache = {}
+        self._etag_cache = {}
+        # get_issue runs concurrently from batch_get_issues' thread pool,
+        # so every read-evict-insert on the ETag cache takes this lock.
+        self._etag_lock = threading.Lock()
+
+    def _build_session(self, cache_path: Optional[str] = None):
+        """
+        Build a pooled session so every call reuses keep-alive connections
+        instead of paying a TCP+TLS handshake per request.
+
+        With cache_path set and the optional requests-cache package
+        installed, GET responses are additionally persisted to a SQLite
+        file so repeated CLI invocations skip the network entirely while
+        the entry is fresh.
+        """
+        session = None
+        if cache_path:
+            try:
+                import requests_cache
+                session = requests_cache.CachedSession(
+                    cache_name=str(Path(cache_path).expanduser()),
+                    backend="sqlite",
+                    # Only slow-changing metadata is safe to serve from disk;
+                    # issue reads must always see fresh data (a just-created
+                    # issue has to show up in the next list-issues).
+                    expire_after=requests_cache.DO_NOT_CACHE,
+                    urls_expire_after={
+                        "*/api/admin/*": METADATA_CACHE_TTL,
+                        "*/api/workflows*": WORKFLOW_CACHE_TTL,
+                        "*/api/issueLinkTypes*": METADATA_CACHE_TTL,
+                    },
+                    allowable_methods=("GET",),
+                )
+            except ImportError:
+                pass
+        if session is None:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS"],
+                respect_retry_after_header=True,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Content-Type describes a request body, so plain GETs leave it out;
+        # JSON-bodied calls add it per request via _json_headers.
+        headers = {k: v for k, v in self._headers().items() if k != "Content-Type"}
+        session.headers.update(headers)
+        session.headers["Connection"] = "keep-alive"
+        try:
+            import brotli  # noqa: F401  (urllib3 decodes br when present)
+            session.headers["Accept-Encoding"] = "br, gzip, deflate"
+        except ImportError:
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+        session.verify = False
+        return session
+
+    def close(self):
+        """Release the pooled connections held by the session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     @classmethod
     def from_config(cls, config_path: Optional[str] = None):
@@ -43,29 +227,117 @@ class YouTrackClient:
         Load YouTrack credentials from a .youtrack.toml file.
         """
         config_file = config_path or str(Path.home() / ".youtrack.toml")
-        config = toml.load(config_file)
+        config = _load_config(config_file)
         token = config["youtrack"]["token"]
         base_url = config["youtrack"]["base_url"]
-        return cls(token, base_url)
+        cache_path = config["youtrack"].get("cache_path")
+        return cls(token, base_url, cache_path=cache_path)
 
     def _headers(self):
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        return self._headers_cached
+
+    def _cached(self, key, fetch, ttl=METADATA_CACHE_TTL):
+        """
+        Return a cached result for slow-changing metadata lookups.
+
+        :param key: Cache key tuple, starting with the method name.
+        :param fetch: Zero-argument callable performing the actual request.
+        :param ttl: Seconds before the cached value expires.
+        """
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        value = fetch()
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_cache(self, prefix: Optional[str] = None):
+        """
+        Drop cached metadata. With a prefix (method name), only that method's entries.
+
+        Also clears the persistent HTTP cache when the session is backed by
+        requests-cache, so a bypass really reaches the server.
+        """
+        if prefix is None:
+            self._cache.clear()
+        else:
+            for key in [k for k in self._cache if k[0] == prefix]:
+                del self._cache[key]
+        cache = getattr(self._session, "cache", None)
+        if cache is not None:
+            cache.clear()
+
+    def _cached_get(self, url, params=None):
+        """
+        GET with ETag-based revalidation.
+
+        The last ETag seen per URL is replayed as If-None-Match; on a
+        304 Not Modified the previously parsed body is returned without
+        transferring or re-parsing the payload.
+        """
+        key = url if not params else f"{url}?{urlencode(sorted(params.items()))}"
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._session.get(url, params=params, headers=headers, timeout=_DEFAULT_TIMEOUT)
+        if cached and response.status_code == 304:
+            # Refresh the entry's recency (dicts iterate oldest-first);
+            # another thread may have evicted it meanwhile, hence the default.
+            with self._etag_lock:
+                self._etag_cache.pop(key, None)
+                self._etag_cache[key] = cached
+            return cached[1]
+        body = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            # Bounded LRU: batch scripts fetching thousands of issues must
+            # not grow memory for the lifetime of the client.
+            with self._etag_lock:
+                self._etag_cache.pop(key, None)
+                if len(self._etag_cache) >= _ETAG_CACHE_MAX:
+                    self._etag_cache.pop(next(iter(self._etag_cache)))
+                self._etag_cache[key] = (etag, body)
+        return body
+
+    def _request(self, method, url, *, params=None, json=None, data=None, files=None, headers=None, timeout=_DEFAULT_TIMEOUT):
+        """
+        Single funnel for HTTP calls.
+
+        Keeping every request on one code path means cross-cutting
+        concerns — JSON body encoding, per-request headers, timeouts —
+        are handled once instead of at twenty call sites.
+
+        :param method: HTTP verb.
+        :param url: Absolute URL to call.
+        :param json: Body to serialize as JSON (via _dumps).
+        """
+        if json is not None:
+            data = _dumps(json)
+            headers = {**self._json_headers, **(headers or {})}
+            if len(data) > _GZIP_BODY_THRESHOLD:
+                # Text-heavy bodies (long descriptions) shrink ~5-10x,
+                # shortening uploads on slow uplinks.
+                data = gzip.compress(data)
+                headers["Content-Encoding"] = "gzip"
+        response = self._session.request(
+            method, url, params=params, data=data, files=files, headers=headers, timeout=timeout
+        )
+        return self._handle_response(response)
 
     def _handle_response(self, response):
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
+            # Read the body once; decoding and truncation happen on the
+            # already-fetched bytes rather than re-reading via .text.
+            raw = response.content
             try:
-                error = response.json()
-                message = error.get('error_description') or error.get('message') or str(error)
+                error = _loads(raw)
+                message = error.get('error_description') or error.get('error') or error.get('message') or str(error)
             except Exception:
-                message = response.text
+                message = raw[:500].decode('utf-8', 'replace')
             raise YouTrackError(f"YouTrack API error: {message}") from e
-        return response.json()
+        return _loads(response.content)
 
     def create_issue(self, project_id: str, summary: str, description: str = "", custom_fields: dict = None, story_points: int = None):
         """
@@ -90,19 +362,19 @@ class YouTrackClient:
             "summary": summary,
             "description": description
         }
-        # Always include 'Story points' if provided
-        custom_fields = custom_fields.copy() if custom_fields else {}
+        # Always include 'Story points' if provided; only copy the caller's
+        # dict when we actually have to add to it.
         if story_points is not None:
+            custom_fields = dict(custom_fields) if custom_fields else {}
             custom_fields["Story points"] = {"name": str(story_points), "value": story_points}
         if custom_fields:
             data["customFields"] = [
-                {"name": k, **(v if isinstance(v, dict) else {"value": v})}
+                {"name": k, **(v if type(v) is dict else {"value": v})}
                 for k, v in custom_fields.items()
             ]
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url, json=data)
 
-    def list_issues(self, project_id: str, query: str = "", limit: int = 20, skip: int = 0):
+    def list_issues(self, project_id: str, query: str = "", limit: int = 20, skip: int = 0, fields: str = _ISSUE_FIELDS):
         """
         List issues in a project with optional query and pagination.
 
@@ -114,12 +386,130 @@ class YouTrackClient:
         :type limit: int, optional
         :param skip: Results to skip.
         :type skip: int, optional
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
         :return: List of issues.
         :rtype: list
         """
-        url = f"{self.base_url}/api/issues?fields=id,summary,description&query=project:{project_id} {query}&$skip={skip}&$top={limit}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = self._issues_url
+        params = {"fields": fields, "query": f"project:{project_id} {query}", "$skip": skip, "$top": limit}
+        return self._request("GET", url, params=params)
+
+    def _stream_page(self, params):
+        """
+        Yield one page of issues incrementally while the body downloads.
+
+        Requires the optional ijson package; parsing overlaps network I/O
+        and only one issue dict is alive at a time instead of the page.
+        """
+        response = self._session.get(self._issues_url, params=params, stream=True, timeout=_DEFAULT_TIMEOUT)
+        if response.status_code >= 400:
+            self._handle_response(response)
+        response.raw.decode_content = True
+        return ijson.items(response.raw, "item")
+
+    def iter_issues(self, project_id: str, query: str = "", page_size: int = 100, skip: int = 0, limit: int = None, fields: str = _ISSUE_FIELDS):
+        """
+        Iterate over issues in a project, fetching pages lazily.
+
+        Issues are yielded as each page arrives, so the first results are
+        available after a single round-trip and memory stays bounded by
+        page_size regardless of the total result count. While the caller
+        consumes a page, the next one is already being fetched on a
+        background thread, overlapping request latency with processing.
+        With the optional ijson package installed each page is instead
+        parsed incrementally off the socket, so issues flow before the
+        page has finished downloading.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :param query: YouTrack query string.
+        :type query: str, optional
+        :param page_size: Number of issues fetched per request.
+        :type page_size: int, optional
+        :param skip: Results to skip before the first page.
+        :type skip: int, optional
+        :param limit: Max total results to yield; None for all.
+        :type limit: int, optional
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
+        :return: Generator of issues.
+        :rtype: Iterator[dict]
+        """
+        remaining = limit
+        if ijson is not None:
+            # Streaming parse consumes the socket as it yields, so pages
+            # are fetched strictly in sequence here.
+            while remaining is None or remaining > 0:
+                top = page_size if remaining is None else min(page_size, remaining)
+                params = {"fields": fields, "query": f"project:{project_id} {query}", "$skip": skip, "$top": top}
+                got = 0
+                for issue in self._stream_page(params):
+                    yield issue
+                    got += 1
+                if got < top:
+                    return
+                skip += top
+                if remaining is not None:
+                    remaining -= top
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            top = page_size if remaining is None else min(page_size, remaining)
+            future = executor.submit(self.list_issues, project_id, query, top, skip, fields)
+            while True:
+                page = future.result()
+                skip += top
+                if remaining is not None:
+                    remaining -= top
+                # Kick off the next page before handing this one to the
+                # caller, so their processing overlaps the round-trip.
+                next_top = None
+                if len(page) == top and (remaining is None or remaining > 0):
+                    next_top = page_size if remaining is None else min(page_size, remaining)
+                    future = executor.submit(self.list_issues, project_id, query, next_top, skip, fields)
+                for issue in page:
+                    yield issue
+                if next_top is None:
+                    return
+                top = next_top
+
+    def list_all_issues(self, project_id: str, query: str = "", page_size: int = 100, concurrency: int = 8, fields: str = _ISSUE_FIELDS):
+        """
+        Fetch every issue in a project, requesting pages concurrently.
+
+        Pages are fetched in waves of `concurrency` parallel requests over
+        the pooled session, so a large result set costs roughly
+        ceil(pages / concurrency) round-trips instead of one per page.
+        Order matches sequential pagination. Prefer iter_issues when you
+        want results streamed one at a time.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :param query: YouTrack query string.
+        :type query: str, optional
+        :param page_size: Number of issues fetched per request.
+        :type page_size: int, optional
+        :param concurrency: Pages fetched in parallel per wave.
+        :type concurrency: int, optional
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
+        :return: All matching issues.
+        :rtype: list
+        """
+        issues = []
+        skip = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                offsets = [skip + i * page_size for i in range(concurrency)]
+                pages = list(executor.map(
+                    lambda offset: self.list_issues(project_id, query, page_size, offset, fields),
+                    offsets,
+                ))
+                for page in pages:
+                    issues.extend(page)
+                    if len(page) < page_size:
+                        return issues
+                skip += concurrency * page_size
 
     def update_issue(self, issue_id: str, summary: str = None, description: str = None, custom_fields: dict = None):
         """
@@ -137,17 +527,16 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/issues/{issue_id}?fields=id,summary,description"
-        data = {}
-        if summary is not None:
-            data["summary"] = summary
-        if description is not None:
-            data["description"] = description
-        if custom_fields:
-            data["customFields"] = custom_fields
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        # One comprehension drops unset fields; the body then goes straight
+        # through _dumps (orjson when installed) in _request.
+        data = {
+            k: v
+            for k, v in (("summary", summary), ("description", description), ("customFields", custom_fields or None))
+            if v is not None
+        }
+        return self._request("POST", url, json=data)
 
-    def search_issues(self, query: str, limit: int = 20, skip: int = 0):
+    def search_issues(self, query: str, limit: int = 20, skip: int = 0, fields: str = _ISSUE_FIELDS):
         """
         Search for issues using a YouTrack query.
 
@@ -157,12 +546,14 @@ class YouTrackClient:
         :type limit: int, optional
         :param skip: Results to skip.
         :type skip: int, optional
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
         :return: List of issues.
         :rtype: list
         """
-        url = f"{self.base_url}/api/issues?fields=id,summary,description&query={query}&$skip={skip}&$top={limit}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = self._issues_url
+        params = {"fields": fields, "query": query, "$skip": skip, "$top": limit}
+        return self._request("GET", url, params=params)
 
     def add_comment(self, issue_id: str, text: str):
         """
@@ -177,8 +568,7 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/issues/{issue_id}/comments?fields=id,text,author"
         data = {"text": text}
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url, json=data)
 
     def transition_issue(self, issue_id: str, field_name: str, new_state: str):
         """
@@ -195,8 +585,7 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/issues/{issue_id}/fields/{field_name}"
         data = {"name": field_name, "value": {"name": new_state}}
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url, json=data)
 
     def attach_file(self, issue_id: str, file_path: str):
         """
@@ -211,25 +600,39 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/issues/{issue_id}/attachments?fields=id,name"
         with open(file_path, "rb") as f:
-            files = {"file": (file_path, f)}
-            headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.post(url, files=files, headers=headers, verify=False)
+            if MultipartEncoder is not None:
+                # Stream the multipart body straight from the file instead of
+                # building it in memory first (matters for large attachments).
+                encoder = MultipartEncoder(
+                    fields={"file": (os.path.basename(file_path), f, "application/octet-stream")}
+                )
+                response = self._session.post(
+                    url, data=encoder, headers={"Content-Type": encoder.content_type},
+                    timeout=_DEFAULT_TIMEOUT,
+                )
+            else:
+                # Same server-visible name and part type as the streaming
+                # branch, so the recorded attachment doesn't depend on
+                # whether requests-toolbelt is installed.
+                files = {"file": (os.path.basename(file_path), f, "application/octet-stream")}
+                response = self._session.post(url, files=files, timeout=_DEFAULT_TIMEOUT)
         return self._handle_response(response)
 
-    def get_issue_history(self, issue_id: str):
+    def get_issue_history(self, issue_id: str, fields: str = "id,timestamp,author,added,removed"):
         """
         Retrieve the history and changes of an issue.
 
         :param issue_id: The ID of the issue.
         :type issue_id: str
+        :param fields: Comma-separated fields to return for each record.
+        :type fields: str, optional
         :return: List of activity records.
         :rtype: list
         """
-        url = f"{self.base_url}/api/issues/{issue_id}/activities?fields=id,timestamp,author,added,removed"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = f"{self.base_url}/api/issues/{issue_id}/activities?fields={fields}"
+        return self._cached_get(url)
 
-    def list_workitems(self, project_id: str, limit: int = 20, skip: int = 0):
+    def list_workitems(self, project_id: str, limit: int = 20, skip: int = 0, fields: str = "id,summary,workItems(id,duration,author,date,description)"):
         """
         List workitems (time tracking entries) in a project, with pagination support.
 
@@ -239,27 +642,78 @@ class YouTrackClient:
         :type limit: int, optional
         :param skip: Results to skip.
         :type skip: int, optional
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
         :return: List of workitems.
         :rtype: list
         """
-        url = f"{self.base_url}/api/issues?fields=id,summary,workItems(id,duration,author,date,description)&query=project:{project_id}&$skip={skip}&$top={limit}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = self._issues_url
+        params = {
+            "fields": fields,
+            "query": f"project:{project_id}",
+            "$skip": skip,
+            "$top": limit,
+        }
+        return self._request("GET", url, params=params)
 
-    def calculate_time_spent(self, issue_id: str):
+    def calculate_time_spent(self, issue_id: str, detailed: bool = False):
         """
-        Calculate total time spent on an issue by summing its workitems' durations.
+        Calculate total time spent on an issue.
+
+        By default the server-side aggregate is used, so only a few bytes
+        travel instead of every workitem. Pass detailed=True to fetch the
+        individual workitems and sum their durations client-side.
 
         :param issue_id: The ID of the issue.
         :type issue_id: str
+        :param detailed: Sum individual workitems instead of using the
+            server-computed total.
+        :type detailed: bool, optional
         :return: Total time spent (minutes).
         :rtype: int
         """
-        url = f"{self.base_url}/api/issues/{issue_id}/timeTracking/workItems?fields=duration"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        workitems = self._handle_response(response)
-        total = sum(wi.get('duration', 0) for wi in workitems)
-        return total
+        if detailed:
+            url = f"{self.base_url}/api/issues/{issue_id}/timeTracking/workItems?fields=duration"
+            workitems = self._request("GET", url)
+            # Time-tracking workitems always carry duration, so the C-level
+            # map/itemgetter pair beats a per-element .get generator.
+            return sum(map(itemgetter('duration'), workitems))
+        # The issue's timeTracking sub-resource exposes the aggregate
+        # directly as spentTime; asking the issue endpoint for
+        # timeTracking(totalTime(minutes)) returns the same number wrapped
+        # one level deeper for a larger payload.
+        url = f"{self.base_url}/api/issues/{issue_id}/timeTracking?fields=spentTime(minutes)"
+        tracking = self._request("GET", url)
+        spent = tracking.get("spentTime") or {}
+        minutes = spent.get("minutes")
+        if minutes is None:
+            # No server-side aggregate (e.g. time tracking disabled for the
+            # project); sum the workitems instead of misreporting 0.
+            return self.calculate_time_spent(issue_id, detailed=True)
+        return minutes
+
+    def calculate_time_spent_bulk(self, issue_ids):
+        """
+        Calculate time spent for many issues with a single request.
+
+        Collapses the N round-trips of calling calculate_time_spent per
+        issue into one query over the issues endpoint.
+
+        :param issue_ids: Issue IDs to total up.
+        :type issue_ids: list
+        :return: Mapping of issue ID to total time spent (minutes).
+        :rtype: dict
+        """
+        params = {
+            "fields": "id,workItems(duration)",
+            "query": "issue ID: " + ",".join(issue_ids),
+            "$top": len(issue_ids),
+        }
+        issues = self._request("GET", self._issues_url, params=params)
+        return {
+            issue["id"]: sum(w.get("duration", 0) for w in issue.get("workItems", []))
+            for issue in issues
+        }
 
     def list_workitem_types(self, project_id: str):
         """
@@ -271,8 +725,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/admin/projects/{project_id}/timetrackingsettings/workitemtypes?fields=id,name,localizedName"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("list_workitem_types", project_id), lambda: self._cached_get(url))
 
     def add_spent_time(self, issue_id: str, duration: int, workitem_type_id: str, description: str = ""):
         """
@@ -291,8 +744,7 @@ class YouTrackClient:
         """
         url = f"{self.base_url}/api/issues/{issue_id}/timeTracking/workItems?fields=id,duration,description,type(id,name)"
         data = {"duration": duration, "description": description, "type": {"id": workitem_type_id}}
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url, json=data)
 
     def list_projects(self):
         """
@@ -302,23 +754,48 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/admin/projects?fields=id,name,shortName"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("list_projects",), lambda: self._cached_get(url))
 
-    def get_issue(self, issue_id: str):
+    def get_issue(self, issue_id: str, fields: str = "id,summary,description,project(id,name)"):
         """
         Retrieve details for a specific issue by its ID.
 
         :param issue_id: The ID of the issue.
         :type issue_id: str
+        :param fields: Comma-separated fields to return.
+        :type fields: str, optional
         :return: Issue details including id, summary, description, and project info.
         :rtype: dict
         """
-        url = f"{self.base_url}/api/issues/{issue_id}?fields=id,summary,description,project(id,name)"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = f"{self.base_url}/api/issues/{issue_id}?fields={fields}"
+        return self._cached_get(url)
 
-    def list_users(self, query: str = "", limit: int = 20, skip: int = 0):
+    def get_issues(self, issue_ids: list, fields: str = "id,summary,description,project(id,name)", chunk: int = 100):
+        """
+        Retrieve many issues via batched searches instead of one request per issue.
+
+        IDs are grouped into chunks and fetched with a single
+        'issue ID: X,Y,Z' query each, collapsing N round-trips into
+        ceil(N/chunk).
+
+        :param issue_ids: The IDs of the issues to fetch.
+        :type issue_ids: list
+        :param fields: Comma-separated fields to return for each issue.
+        :type fields: str, optional
+        :param chunk: Max number of IDs per request.
+        :type chunk: int, optional
+        :return: List of issues.
+        :rtype: list
+        """
+        url = self._issues_url
+        issues = []
+        for start in range(0, len(issue_ids), chunk):
+            batch = issue_ids[start:start + chunk]
+            params = {"fields": fields, "query": "issue ID: " + ",".join(batch), "$top": len(batch)}
+            issues.extend(self._request("GET", url, params=params))
+        return issues
+
+    def list_users(self, query: str = "", limit: int = 20, skip: int = 0, fields: str = "id,login,name,email"):
         """
         List users in the YouTrack instance, optionally filtered by a query string.
 
@@ -328,12 +805,14 @@ class YouTrackClient:
         :type limit: int, optional
         :param skip: Number of users to skip (for pagination).
         :type skip: int, optional
+        :param fields: Comma-separated fields to return for each user.
+        :type fields: str, optional
         :return: List of user dicts with id, login, name, and email.
         :rtype: list
         """
-        url = f"{self.base_url}/api/users?fields=id,login,name,email&query={query}&$skip={skip}&$top={limit}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = f"{self.base_url}/api/users"
+        params = {"fields": fields, "query": query, "$skip": skip, "$top": limit}
+        return self._request("GET", url, params=params)
 
     def list_custom_fields(self, project_id: str):
         """
@@ -345,8 +824,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/admin/projects/{project_id}/customfields?fields=id,name,fieldType(id,valueType)"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("list_custom_fields", project_id), lambda: self._cached_get(url))
 
     def list_workflows(self):
         """
@@ -356,39 +834,43 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/workflows?fields=id,name,description"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("list_workflows",), lambda: self._cached_get(url), ttl=WORKFLOW_CACHE_TTL)
 
-    def list_boards(self, project_id: str = None):
+    def list_boards(self, project_id: str = None, fields: str = "id,name,projects(id,name)"):
         """
         List all agile boards. Optionally filter boards by project ID.
 
         :param project_id: If provided, only boards containing this project are returned.
         :type project_id: str, optional
+        :param fields: Comma-separated fields to return for each board.
+        :type fields: str, optional
         :return: List of boards with id, name, and associated projects.
         :rtype: list
         """
-        url = f"{self.base_url}/api/agiles?fields=id,name,projects(id,name)"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        boards = self._handle_response(response)
+        url = f"{self.base_url}/api/agiles?fields={fields}"
+        params = {"projects": project_id} if project_id else None
+        boards = self._cached_get(url, params=params)
         if project_id:
+            # Keep the Python filter as a safety net for servers that ignore
+            # the projects parameter.
             boards = [b for b in boards if any(p['id'] == project_id for p in b.get('projects', []))]
         return boards
 
-    def list_sprints(self, board_id: str):
+    def list_sprints(self, board_id: str, fields: str = "id,name,start,finish,isArchived"):
         """
         List all sprints for a given agile board.
 
         :param board_id: The ID of the agile board.
         :type board_id: str
+        :param fields: Comma-separated fields to return for each sprint.
+        :type fields: str, optional
         :return: List of sprints with id, name, start, finish, and isArchived status.
         :rtype: list
         """
-        url = f"{self.base_url}/api/agiles/{board_id}/sprints?fields=id,name,start,finish,isArchived"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = f"{self.base_url}/api/agiles/{board_id}/sprints?fields={fields}"
+        return self._cached_get(url)
 
-    def list_user_stories(self, board_id: str, sprint_id: str = None):
+    def list_user_stories(self, board_id: str, sprint_id: str = None, fields: str = "id,summary,customFields(id,name,value(name))"):
         """
         List user stories (epics) on a board, optionally for a specific sprint.
 
@@ -396,14 +878,15 @@ class YouTrackClient:
         :type board_id: str
         :param sprint_id: The ID of the sprint. If provided, only user stories in this sprint are listed.
         :type sprint_id: str, optional
+        :param fields: Comma-separated fields to return for each story.
+        :type fields: str, optional
         :return: List of user stories with id, summary, and custom fields.
         :rtype: list
         """
-        url = f"{self.base_url}/api/agiles/{board_id}/issues?fields=id,summary,customFields(id,name,value(name))"
+        url = f"{self.base_url}/api/agiles/{board_id}/issues?fields={fields}"
         if sprint_id:
             url += f"&sprint={sprint_id}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("GET", url)
 
     def add_issue_to_sprint(self, board_id: str, sprint_id: str, issue_id: str):
         """
@@ -419,8 +902,34 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/agiles/{board_id}/sprints/{sprint_id}/issues/{issue_id}"
-        response = requests.put(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("PUT", url)
+
+    def add_issues_to_sprint(self, board_id: str, sprint_id: str, issue_ids: list, workers: int = 8):
+        """
+        Add several issues to a sprint on a specific agile board.
+
+        YouTrack's REST API has no bulk sprint-membership endpoint, so the
+        per-issue requests are issued concurrently over the pooled session,
+        overlapping the round-trips instead of paying them one by one.
+
+        :param board_id: The ID of the agile board.
+        :type board_id: str
+        :param sprint_id: The ID of the sprint.
+        :type sprint_id: str
+        :param issue_ids: The IDs of the issues to add.
+        :type issue_ids: list
+        :param workers: Max concurrent requests.
+        :type workers: int, optional
+        :return: Per-issue API responses, in the order of issue_ids.
+        :rtype: list
+        """
+        if not issue_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(workers, len(issue_ids))) as executor:
+            return list(executor.map(
+                lambda issue_id: self.add_issue_to_sprint(board_id, sprint_id, issue_id),
+                issue_ids,
+            ))
 
     def add_issue_to_user_story(self, board_id: str, user_story_id: str, issue_id: str):
         """
@@ -436,8 +945,7 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/agiles/{board_id}/issues/{user_story_id}/subtasks/{issue_id}"
-        response = requests.put(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("PUT", url)
 
     def add_user_story_to_sprint(self, board_id: str, sprint_id: str, user_story_id: str):
         """
@@ -453,8 +961,7 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/agiles/{board_id}/sprints/{sprint_id}/issues/{user_story_id}"
-        response = requests.put(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("PUT", url)
 
     def run_report(self, report_id: str):
         """
@@ -466,8 +973,7 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/reports/{report_id}/execute"
-        response = requests.post(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url)
 
     def authenticate(self):
         """
@@ -483,8 +989,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/admin/calendars?fields=id,name,holidays"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("get_deadline_calendars",), lambda: self._cached_get(url))
 
     def get_issue_links(self, issue_id: str):
         """
@@ -496,8 +1001,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/issues/{issue_id}/links?fields=id,direction,linkType(id,name,directed),issues(id,summary)"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached_get(url)
 
     def list_issue_link_types(self):
         """
@@ -507,8 +1011,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/issueLinkTypes?fields=id,name,directed"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached(("list_issue_link_types",), lambda: self._cached_get(url))
 
     def list_issue_link_types_for_issue(self, issue_id: str):
         """
@@ -520,8 +1023,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/issues/{issue_id}/links/types?fields=id,name,directed"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached_get(url)
 
     def list_issue_link_types_for_project(self, project_id: str):
         """
@@ -533,8 +1035,7 @@ class YouTrackClient:
         :rtype: list
         """
         url = f"{self.base_url}/api/admin/projects/{project_id}/issueLinkTypes?fields=id,name,directed"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._cached_get(url)
 
     def add_issue_link(self, source_issue_id: str, target_issue_id: str, link_type_id: str):
         """
@@ -550,10 +1051,9 @@ class YouTrackClient:
         :rtype: dict
         """
         url = f"{self.base_url}/api/issues/{source_issue_id}/links/{link_type_id}/{target_issue_id}"
-        response = requests.put(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("PUT", url)
 
-    def run_query(self, query: str, fields: str = "id,summary,description", limit: int = 20, skip: int = 0):
+    def run_query(self, query: str, fields: str = _ISSUE_FIELDS, limit: int = 20, skip: int = 0):
         """
         Run a search query on issues, returning selected fields.
 
@@ -568,9 +1068,9 @@ class YouTrackClient:
         :return: List of issues matching the query.
         :rtype: list
         """
-        url = f"{self.base_url}/api/issues?fields={fields}&query={query}&$skip={skip}&$top={limit}"
-        response = requests.get(url, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        url = self._issues_url
+        params = {"fields": fields, "query": query, "$skip": skip, "$top": limit}
+        return self._request("GET", url, params=params)
 
     def run_command(self, issue_id: str, command: str, comment: str = None):
         """
@@ -589,5 +1089,4 @@ class YouTrackClient:
         data = {"query": command}
         if comment:
             data["comment"] = {"text": comment}
-        response = requests.post(url, json=data, headers=self._headers(), verify=False)
-        return self._handle_response(response)
+        return self._request("POST", url, json=data)
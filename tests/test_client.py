@@ -1,13 +1,19 @@
+import gzip
+import json
+import types
 import pytest
+from youtrack import client as client_module
 from youtrack.client import YouTrackClient, YouTrackError
 import requests
 
 class DummyResponse:
-    def __init__(self, json_data, status_code=200):
+    def __init__(self, json_data, status_code=200, headers=None):
         self._json = json_data
         self.status_code = status_code
         self._raise = status_code >= 400
         self.text = str(json_data)
+        self.content = json.dumps(json_data).encode()
+        self.headers = headers or {}
     def json(self):
         return self._json
     def raise_for_status(self):
@@ -37,3 +43,87 @@ def test_init():
     c = YouTrackClient(token="abc", base_url="https://yt")
     assert c.token == "abc"
     assert c.base_url == "https://yt"
+
+class PagedClient(YouTrackClient):
+    """Client whose list_issues serves slices of a fixed issue list."""
+    __slots__ = ("issues", "calls")
+    def __init__(self, count):
+        super().__init__(token="dummy", base_url="https://example.com")
+        self.issues = [{"id": i} for i in range(count)]
+        self.calls = []
+    def list_issues(self, project_id, query="", limit=20, skip=0, fields="id"):
+        self.calls.append(skip)
+        return self.issues[skip:skip + limit]
+
+class DummySession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return self.responses.pop(0)
+    def get(self, url, **kwargs):
+        self.requests.append(("GET", url, kwargs))
+        return self.responses.pop(0)
+
+def test_iter_issues_paginates_until_short_page(monkeypatch):
+    # Pin the page-list branch; with ijson installed iter_issues streams
+    # through the session instead of list_issues.
+    monkeypatch.setattr(client_module, "ijson", None)
+    client = PagedClient(7)
+    assert [i["id"] for i in client.iter_issues("PRJ", page_size=3)] == list(range(7))
+    assert client.calls == [0, 3, 6]
+
+def test_iter_issues_respects_limit_and_skip(monkeypatch):
+    monkeypatch.setattr(client_module, "ijson", None)
+    client = PagedClient(10)
+    assert [i["id"] for i in client.iter_issues("PRJ", page_size=3, limit=4)] == list(range(4))
+    client = PagedClient(10)
+    assert [i["id"] for i in client.iter_issues("PRJ", page_size=4, skip=8)] == [8, 9]
+
+def test_iter_issues_streams_pages_when_ijson_available(monkeypatch, client):
+    class StreamResponse:
+        def __init__(self, items):
+            self.status_code = 200
+            self.raw = types.SimpleNamespace(items=items, decode_content=False)
+    monkeypatch.setattr(
+        client_module, "ijson",
+        types.SimpleNamespace(items=lambda raw, prefix: iter(raw.items)),
+    )
+    client._session = DummySession([
+        StreamResponse([{"id": 0}, {"id": 1}, {"id": 2}]),
+        StreamResponse([{"id": 3}]),
+    ])
+    assert [i["id"] for i in client.iter_issues("PRJ", page_size=3)] == [0, 1, 2, 3]
+    first, second = client._session.requests
+    assert first[2]["params"]["$skip"] == 0 and first[2]["stream"] is True
+    assert second[2]["params"]["$skip"] == 3
+
+def test_list_all_issues_preserves_order_and_stops():
+    client = PagedClient(7)
+    result = client.list_all_issues("PRJ", page_size=3, concurrency=4)
+    assert [i["id"] for i in result] == list(range(7))
+
+def test_request_gzips_large_json_bodies(client):
+    client._session = DummySession([DummyResponse({"ok": True})])
+    client._request("POST", "https://example.com/api", json={"description": "x" * 10000})
+    _, _, kwargs = client._session.requests[0]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(kwargs["data"]))
+    assert body["description"] == "x" * 10000
+
+def test_request_leaves_small_json_bodies_uncompressed(client):
+    client._session = DummySession([DummyResponse({"ok": True})])
+    client._request("POST", "https://example.com/api", json={"summary": "short"})
+    _, _, kwargs = client._session.requests[0]
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"]) == {"summary": "short"}
+
+def test_cached_get_replays_etag_and_serves_304_from_cache(client):
+    fresh = DummyResponse({"n": 1}, headers={"ETag": '"v1"'})
+    not_modified = DummyResponse(None, status_code=304)
+    client._session = DummySession([fresh, not_modified])
+    assert client._cached_get("https://example.com/api/admin/projects") == {"n": 1}
+    assert client._cached_get("https://example.com/api/admin/projects") == {"n": 1}
+    _, _, kwargs = client._session.requests[1]
+    assert kwargs["headers"] == {"If-None-Match": '"v1"'}